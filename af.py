@@ -8,8 +8,18 @@ import json
 # Constants: URL cơ bản cho ArXiv API
 API_URL = "http://export.arxiv.org/api/query?"
 
+# Tên thẻ Atom đầy đủ, tránh phải phân giải tiền tố namespace ở mỗi lần tìm kiếm
+ATOM_ENTRY = '{http://www.w3.org/2005/Atom}entry'
+ATOM_TITLE = '{http://www.w3.org/2005/Atom}title'
+ATOM_SUMMARY = '{http://www.w3.org/2005/Atom}summary'
+ATOM_AUTHOR_NAME = '{http://www.w3.org/2005/Atom}author/{http://www.w3.org/2005/Atom}name'
+
 # Tải mô hình ngôn ngữ của SpaCy
-nlp = spacy.load("en_core_web_sm")
+nlp = spacy.load("en_core_web_sm", disable=["ner", "lemmatizer", "attribute_ruler", "tagger"])
+
+# Mã băm của các nhãn phụ thuộc, so sánh số nguyên nhanh hơn so sánh chuỗi dep_
+SUBJ_DEPS = {nlp.vocab.strings["nsubj"], nlp.vocab.strings["nsubjpass"]}
+OBJ_DEPS = {nlp.vocab.strings["dobj"], nlp.vocab.strings["pobj"], nlp.vocab.strings["attr"]}
 
 def fetch_arxiv_papers(keyword, num_results=5):
     """
@@ -26,7 +36,7 @@ def fetch_arxiv_papers(keyword, num_results=5):
 
     try:
         response = urllib.request.urlopen(query_url)
-        data = response.read().decode('utf-8')
+        data = response.read()
         return parse_arxiv_results(data)
     except Exception as e:
         print(f"Error fetching papers: {e}")
@@ -36,16 +46,15 @@ def parse_arxiv_results(data):
     """
     Parse XML data returned from ArXiv API and extract paper details.
     """
-    namespace = {'atom': 'http://www.w3.org/2005/Atom'}
     root = ET.fromstring(data)
-    entries = root.findall('atom:entry', namespace)
+    entries = root.findall(ATOM_ENTRY)
 
     papers = []
     for entry in entries:
         try:
-            title = entry.find('atom:title', namespace).text.strip()
-            authors = [author.find('atom:name', namespace).text for author in entry.findall('atom:author', namespace)]
-            summary = entry.find('atom:summary', namespace).text.strip()
+            title = entry.find(ATOM_TITLE).text.strip()
+            authors = [name.text for name in entry.iterfind(ATOM_AUTHOR_NAME)]
+            summary = entry.find(ATOM_SUMMARY).text.strip()
             papers.append({'title': title, 'authors': authors, 'summary': summary})
         except AttributeError:
             continue
@@ -57,12 +66,13 @@ def extract_svo(text):
     """
     doc = nlp(text)
     svos = []
-    for token in doc:
-        if token.dep_ == "ROOT":
-            subjects = [w.text for w in token.lefts if w.dep_ in ("nsubj", "nsubjpass")]
-            objects = [w.text for w in token.rights if w.dep_ in ("dobj", "pobj", "attr")]
-            if subjects and objects:
-                svos.append((subjects[0], token.text, objects[0]))
+    # Mỗi câu có đúng một gốc, lấy trực tiếp qua sent.root thay vì quét mọi token
+    for sent in doc.sents:
+        root = sent.root
+        subjects = [w.text for w in root.lefts if w.dep in SUBJ_DEPS]
+        objects = [w.text for w in root.rights if w.dep in OBJ_DEPS]
+        if subjects and objects:
+            svos.append((subjects[0], root.text, objects[0]))
     return svos
 
 def emphasize_keywords(svos):
@@ -1,102 +1,350 @@
-import spacy
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from io import BytesIO
+from itertools import chain
+import multiprocessing
+import os
+import sys
+import threading
+import time
 import urllib.error
 import urllib.parse
-import urllib.request
-import xml.etree.ElementTree as ET
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+try:
+    from lxml import etree as ET
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAS_LXML = False
 import json
-from wordcloud import WordCloud
-import matplotlib.pyplot as plt
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 # Constants: URL cơ bản cho ArXiv API
 API_URL = "http://export.arxiv.org/api/query?"
 
-# Tải mô hình ngôn ngữ của SpaCy
-nlp = spacy.load("en_core_web_sm")
+# Số kết quả tối đa arXiv trả về cho mỗi lần gọi API; chỉ chia cửa sổ khi vượt quá.
+# Quy định sử dụng API của arXiv: mỗi lúc chỉ một kết nối, cách nhau khoảng 3 giây,
+# nên các cửa sổ được tải lần lượt và giãn cách API_REQUEST_INTERVAL.
+PAGE_SIZE = 2000
+API_REQUEST_INTERVAL = 3.0
 
-def fetch_arxiv_papers(keyword, num_results=5):
+# Số tóm tắt tối thiểu cần phân tích để đáng chia sang nhiều tiến trình,
+# và số tóm tắt giao cho mỗi tiến trình/luồng trong một lần
+PARALLEL_ANALYSIS_THRESHOLD = 64
+ANALYSIS_CHUNK_SIZE = 8
+
+# Tên thẻ Atom đầy đủ, tránh phải phân giải tiền tố namespace ở mỗi lần tìm kiếm
+ATOM_NAMESPACE = {'atom': 'http://www.w3.org/2005/Atom'}
+ATOM_ENTRY = '{http://www.w3.org/2005/Atom}entry'
+ATOM_TITLE = '{http://www.w3.org/2005/Atom}title'
+ATOM_SUMMARY = '{http://www.w3.org/2005/Atom}summary'
+ATOM_AUTHOR_NAME = '{http://www.w3.org/2005/Atom}author/{http://www.w3.org/2005/Atom}name'
+
+# Biên dịch sẵn các biểu thức XPath dùng để đọc kết quả Atom khi có lxml
+if HAS_LXML:
+    get_title = ET.XPath('atom:title/text()', namespaces=ATOM_NAMESPACE, smart_strings=False)
+    get_authors = ET.XPath('atom:author/atom:name/text()', namespaces=ATOM_NAMESPACE, smart_strings=False)
+    get_summary = ET.XPath('atom:summary/text()', namespaces=ATOM_NAMESPACE, smart_strings=False)
+
+# Dùng chung một Session để giữ kết nối keep-alive tới ArXiv giữa các lần truy vấn
+_session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=Retry(total=3, backoff_factor=0.5))
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+
+# Khóa bảo đảm chỉ một yêu cầu tới arXiv tại một thời điểm
+_request_lock = threading.Lock()
+_last_request_time = 0.0
+
+@lru_cache(maxsize=None)
+def _get_nlp():
     """
-    Fetch papers from ArXiv using the API sorted by the most recent submission date.
+    Load the SpaCy language model on first use.
+    """
+    # Chỉ import SpaCy khi thật sự cần phân tích, để menu khởi động nhanh
+    import spacy
+    return spacy.load("en_core_web_sm", disable=["ner", "lemmatizer", "attribute_ruler", "tagger"])
+
+@lru_cache(maxsize=None)
+def _get_dependency_ids():
+    """
+    Resolve the subject and object dependency labels to their integer IDs.
+    """
+    # Mã băm của các nhãn phụ thuộc, so sánh số nguyên nhanh hơn so sánh chuỗi dep_
+    strings = _get_nlp().vocab.strings
+    subj_deps = {strings["nsubj"], strings["nsubjpass"]}
+    obj_deps = {strings["dobj"], strings["pobj"], strings["attr"]}
+    return subj_deps, obj_deps
+
+# Bộ nhớ đệm kết quả phân tích, khóa là nội dung tóm tắt
+_analysis_cache = {}
+
+# Automaton Aho-Corasick chứa mọi từ khóa đã dùng để xếp hạng trong phiên,
+# cùng số lần xuất hiện của các từ khóa đó theo từng tóm tắt
+_keyword_automaton = None
+_keyword_counts = {}
+
+@dataclass
+class PaperStore:
+    """
+    Column-oriented storage of fetched papers, one list per field, for fast bulk scans.
+    """
+    titles: list = field(default_factory=list)
+    authors: list = field(default_factory=list)
+    summaries: list = field(default_factory=list)
+    titles_lc: list = field(default_factory=list)
+    authors_lc: list = field(default_factory=list)
+    summaries_lc: list = field(default_factory=list)
+
+    @classmethod
+    def from_papers(cls, papers):
+        """
+        Build a store from an iterable of paper dicts, or return the store unchanged.
+        """
+        if isinstance(papers, cls):
+            return papers
+        store = cls()
+        for paper in papers:
+            store.append(paper)
+        return store
+
+    def append(self, paper):
+        """
+        Add a paper dict to the store, precomputing its lowercase columns.
+        """
+        self.titles.append(paper['title'])
+        self.authors.append(paper['authors'])
+        self.summaries.append(paper['summary'])
+        self.titles_lc.append(paper['title'].lower())
+        self.authors_lc.append(tuple(author.lower() for author in paper['authors']))
+        self.summaries_lc.append(paper['summary'].lower())
+
+    def row(self, i):
+        """
+        Build the paper dict for a single row index.
+        """
+        return {'title': self.titles[i], 'authors': self.authors[i], 'summary': self.summaries[i]}
+
+    def select(self, indices):
+        """
+        Build a new store holding only the given row indices, in that order.
+        """
+        indices = list(indices)
+        return PaperStore(
+            titles=[self.titles[i] for i in indices],
+            authors=[self.authors[i] for i in indices],
+            summaries=[self.summaries[i] for i in indices],
+            titles_lc=[self.titles_lc[i] for i in indices],
+            authors_lc=[self.authors_lc[i] for i in indices],
+            summaries_lc=[self.summaries_lc[i] for i in indices],
+        )
+
+    def __len__(self):
+        return len(self.titles)
+
+    def __iter__(self):
+        return (self.row(i) for i in range(len(self)))
+
+def fetch_arxiv_page(keyword, start, max_results):
+    """
+    Fetch one window of search results from the ArXiv API as raw XML bytes.
     """
     query_params = {
         'search_query': f"all:{keyword}",
-        'start': 0,
-        'max_results': num_results,
+        'start': start,
+        'max_results': max_results,
         'sortBy': 'submittedDate',
         'sortOrder': 'descending'
     }
     query_url = API_URL + urllib.parse.urlencode(query_params)
 
-    try:
-        response = urllib.request.urlopen(query_url)
-        data = response.read().decode('utf-8')
-        return parse_arxiv_results(data)
-    except Exception as e:
-        print(f"Error fetching papers: {e}")
-        return []
+    global _last_request_time
+    with _request_lock:
+        wait = _last_request_time + API_REQUEST_INTERVAL - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        try:
+            response = _session.get(query_url, timeout=30)
+        finally:
+            _last_request_time = time.monotonic()
+    response.raise_for_status()
+    return response.content
 
-def parse_arxiv_results(data):
+def fetch_arxiv_papers(keyword, num_results=5):
     """
-    Parse XML data returned from ArXiv API and extract paper details.
+    Fetch papers from ArXiv using the API sorted by the most recent submission date.
     """
-    root = ET.fromstring(data)
-    namespace = {'atom': 'http://www.w3.org/2005/Atom'}
-    entries = root.findall('atom:entry', namespace)
+    # Một lần gọi là đủ tới PAGE_SIZE kết quả; lớn hơn thì chia thành các cửa sổ PAGE_SIZE
+    windows = [(start, min(PAGE_SIZE, num_results - start)) for start in range(0, num_results, PAGE_SIZE)]
+    if not windows:
+        windows = [(0, num_results)]
 
-    papers = []
-    for entry in entries:
+    # Giữ lại các cửa sổ tải thành công, chỉ báo lỗi cho cửa sổ thất bại
+    pages = []
+    for start, size in windows:
         try:
-            title = entry.find('atom:title', namespace).text.strip()
-            authors = [author.find('atom:name', namespace).text for author in entry.findall('atom:author', namespace)]
-            summary = entry.find('atom:summary', namespace).text.strip()
-            papers.append({'title': title, 'authors': authors, 'summary': summary})
-        except AttributeError:
-            continue
-    return papers
+            pages.append(fetch_arxiv_page(keyword, start, size))
+        except Exception as e:
+            print(f"Error fetching papers {start + 1}-{start + size}: {e}")
+
+    store = PaperStore()
+    for data in pages:
+        try:
+            for paper in parse_arxiv_results(data):
+                store.append(paper)
+        except Exception as e:
+            print(f"Error parsing papers: {e}")
+    return store
 
-def preprocess_text(text):
+def parse_arxiv_results(data):
     """
-    Preprocess text by removing stop words using SpaCy.
+    Parse XML data returned from ArXiv API and yield paper details one entry at a time.
+    Accepts raw bytes (preferred) or a decoded str.
     """
-    doc = nlp(text)
-    return " ".join([token.text for token in doc if token.is_alpha and not token.is_stop])
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    if not HAS_LXML:
+        yield from parse_arxiv_results_stdlib(data)
+        return
 
-def extract_keywords(text, top_n=10):
+    for _, entry in ET.iterparse(BytesIO(data), events=('end',), tag=ATOM_ENTRY):
+        title = get_title(entry)
+        summary = get_summary(entry)
+        if title and summary:
+            yield {'title': title[0].strip(), 'authors': get_authors(entry), 'summary': summary[0].strip()}
+
+        # Giải phóng các entry đã xử lý để cây XML không lớn dần
+        entry.clear()
+        while entry.getprevious() is not None:
+            del entry.getparent()[0]
+
+def parse_arxiv_results_stdlib(data):
     """
-    Extract keywords based on frequency from the processed text.
+    Parse XML data with the standard library ElementTree when lxml is not installed.
+    Accepts raw bytes (preferred) or a decoded str.
     """
-    doc = nlp(text)
-    keywords = [token.text for token in doc if token.is_alpha and not token.is_stop]
-    keyword_freq = Counter(keywords)
-    return keyword_freq.most_common(top_n)
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    for _, entry in ET.iterparse(BytesIO(data), events=('end',)):
+        if entry.tag != ATOM_ENTRY:
+            continue
+        title = entry.find(ATOM_TITLE)
+        summary = entry.find(ATOM_SUMMARY)
+        if title is not None and title.text and summary is not None and summary.text:
+            authors = [name.text for name in entry.iterfind(ATOM_AUTHOR_NAME)]
+            yield {'title': title.text.strip(), 'authors': authors, 'summary': summary.text.strip()}
+        entry.clear()
 
-def extract_svo(text):
+def analyze(doc):
     """
-    Extract Subject-Verb-Object structures from text using SpaCy.
+    Extract keywords and Subject-Verb-Object structures from a parsed Doc.
     """
-    doc = nlp(text)
+    # Chỉ import numpy khi phân tích, giống SpaCy, để menu khởi động nhanh
+    import numpy as np
+
+    subj_deps, obj_deps = _get_dependency_ids()
+    strings = doc.vocab.strings
+
+    # Đọc toàn bộ thuộc tính cần dùng vào một mảng numpy thay vì truy cập từng Token
+    arr = doc.to_array(["DEP", "HEAD", "ORTH", "IS_ALPHA", "IS_STOP"])
+    deps = arr[:, 0]
+    # HEAD là độ lệch tương đối (lưu dạng uint64), đổi sang chỉ số tuyệt đối
+    heads = arr[:, 1].astype(np.int64) + np.arange(len(arr))
+
+    keyword_ids = Counter(arr[(arr[:, 3] == 1) & (arr[:, 4] == 0), 2].tolist())
+    keyword_freq = Counter({strings[orth]: count for orth, count in keyword_ids.items()})
+
+    is_subj = np.isin(deps, np.array(list(subj_deps), dtype=np.uint64))
+    is_obj = np.isin(deps, np.array(list(obj_deps), dtype=np.uint64))
     svos = []
-    for token in doc:
-        if token.dep_ == "ROOT":
-            subjects = [w.text for w in token.lefts if w.dep_ in ("nsubj", "nsubjpass")]
-            objects = [w.text for w in token.rights if w.dep_ in ("dobj", "pobj", "attr")]
-            if subjects and objects:
-                svos.append((subjects[0], token.text, objects[0]))
-    return svos
+    # Mỗi câu có đúng một gốc (sent.root), chỉ xét các token trong phạm vi câu đó
+    for sent in doc.sents:
+        start, end, root = sent.start, sent.end, sent.root.i
+        subjects = np.flatnonzero((heads[start:root] == root) & is_subj[start:root])
+        objects = np.flatnonzero((heads[root + 1:end] == root) & is_obj[root + 1:end])
+        if subjects.size and objects.size:
+            svos.append((doc[start + int(subjects[0])].text, sent.root.text, doc[root + 1 + int(objects[0])].text))
+    return keyword_freq, svos
 
-def summarize_papers(papers):
+def clear_caches():
+    """
+    Drop cached summary analyses and keyword counts, e.g. before fetching a new result set.
+    """
+    _analysis_cache.clear()
+    _keyword_counts.clear()
+
+def analyze_chunk(summaries):
+    """
+    Parse a chunk of summaries with nlp.pipe and return (summary, analysis) pairs.
+    """
+    docs = _get_nlp().pipe(summaries, batch_size=len(summaries))
+    return [(summary, analyze(doc)) for summary, doc in zip(summaries, docs)]
+
+def analyze_papers(papers):
+    """
+    Analyze paper summaries that are not cached yet and return the cached results in order.
+    """
+    # Đọc trực tiếp cột summaries của PaperStore, không dựng lại dict cho từng bài
+    if isinstance(papers, PaperStore):
+        summaries = papers.summaries
+    else:
+        summaries = [paper['summary'] for paper in papers]
+
+    # Chỉ phân tích những tóm tắt chưa có trong bộ nhớ đệm
+    pending = list(dict.fromkeys(summary for summary in summaries if summary not in _analysis_cache))
+    if len(pending) >= PARALLEL_ANALYSIS_THRESHOLD:
+        # Nạp mô hình trước khi tạo tiến trình/luồng con để chúng dùng chung
+        _get_dependency_ids()
+        # Không tạo nhiều worker hơn số khối ANALYSIS_CHUNK_SIZE cần xử lý
+        # Mỗi worker nhận một khối ANALYSIS_CHUNK_SIZE tóm tắt và phân tích bằng nlp.pipe
+        chunks = [pending[i:i + ANALYSIS_CHUNK_SIZE] for i in range(0, len(pending), ANALYSIS_CHUNK_SIZE)]
+        # Không tạo nhiều worker hơn số khối cần xử lý
+        workers = min(os.cpu_count() or 1, len(chunks))
+        if sys.platform.startswith('linux'):
+            # Tiến trình con tạo bằng fork dùng chung mô hình nlp đã tải theo cơ chế copy-on-write
+            with multiprocessing.get_context('fork').Pool(processes=workers) as pool:
+                _analysis_cache.update(chain.from_iterable(pool.imap_unordered(analyze_chunk, chunks)))
+        else:
+            # Windows/macOS không dùng fork an toàn: dùng luồng, bộ phân tích cú pháp Cython của SpaCy nhả GIL
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                _analysis_cache.update(chain.from_iterable(executor.map(analyze_chunk, chunks)))
+    elif pending:
+        # Phân tích tất cả tóm tắt trong một lần gọi nlp.pipe thay vì gọi nlp() cho từng bài
+        for summary, doc in zip(pending, _get_nlp().pipe(pending, batch_size=min(64, len(pending)))):
+            _analysis_cache[summary] = analyze(doc)
+    return [_analysis_cache[summary] for summary in summaries]
+
+def keyword_frequencies(papers):
+    """
+    Aggregate the cached keyword counters of the given papers.
+    """
+    total = Counter()
+    for keyword_freq, _ in analyze_papers(papers):
+        total.update(keyword_freq)
+    return total
+
+def summarize_papers(papers, top_n=10):
     """
     Apply text processing framework to ArXiv paper summaries.
     """
-    for paper in papers:
-        print(f"Title: {paper['title']}")
-        print(f"Authors: {', '.join(paper['authors'])}")
-        processed_text = preprocess_text(paper['summary'])
-        keywords = extract_keywords(processed_text)
-        svos = extract_svo(paper['summary'])
+    papers = PaperStore.from_papers(papers)
+    for title, authors, (keyword_freq, svos) in zip(papers.titles, papers.authors, analyze_papers(papers)):
+        print(f"Title: {title}")
+        print(f"Authors: {', '.join(authors)}")
 
         print("Keywords:")
-        for word, freq in keywords:
+        for word, freq in keyword_freq.most_common(top_n):
             print(f"- {word}: {freq} occurrences")
 
         print("SVO Structures:")
@@ -104,53 +352,122 @@ def summarize_papers(papers):
             print(f"- {svo[0]} → {svo[1]} → {svo[2]}")
         print("=" * 50)
 
+def encode_json(obj):
+    """
+    Encode an object as compact UTF-8 JSON bytes, using orjson when available.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
 def save_papers_to_file(papers, filename="papers.json"):
     """
     Save the fetched papers to a JSON file.
     """
     try:
-        with open(filename, 'w') as file:
-            json.dump(papers, file, indent=4)
+        # Ghi từng bài một để không phải giữ toàn bộ chuỗi JSON trong bộ nhớ
+        with open(filename, 'wb') as file:
+            file.write(b'[\n')
+            for i, paper in enumerate(papers):
+                if i:
+                    file.write(b',\n')
+                file.write(encode_json(paper))
+            file.write(b'\n]\n')
         print(f"Papers saved to {filename}")
     except Exception as e:
         print(f"Error saving papers: {e}")
 
 def filter_papers_by_author(papers, author_name):
     """
-    Filter the list of papers to include only those written by the specified author.
+    Filter the papers to include only those written by the specified author.
     """
-    return [paper for paper in papers if author_name.lower() in (author.lower() for author in paper['authors'])]
+    papers = PaperStore.from_papers(papers)
+    author_name = author_name.lower()
+    return papers.select(i for i, authors in enumerate(papers.authors_lc) if author_name in authors)
 
 def search_papers_by_title(papers, keyword):
     """
     Search for papers with the specified keyword in their title.
     """
-    return [paper for paper in papers if keyword.lower() in paper['title'].lower()]
+    papers = PaperStore.from_papers(papers)
+    keyword = keyword.lower()
+    return papers.select(i for i, title in enumerate(papers.titles_lc) if keyword in title)
+
+def count_keyword_occurrences(summaries_lc, keyword):
+    """
+    Count a keyword in lowercase summaries with an Aho-Corasick automaton shared across queries.
+    """
+    global _keyword_automaton
+    if _keyword_automaton is None:
+        _keyword_automaton = ahocorasick.Automaton()
+    if keyword not in _keyword_automaton:
+        _keyword_automaton.add_word(keyword, keyword)
+        _keyword_automaton.make_automaton()
+        _keyword_counts.clear()
+
+    # Một lần quét mỗi tóm tắt đếm được mọi từ khóa trong automaton, các truy vấn sau dùng lại kết quả
+    scores = []
+    for summary in summaries_lc:
+        counts = _keyword_counts.get(summary)
+        if counts is None:
+            counts = _keyword_counts[summary] = count_non_overlapping(_keyword_automaton.iter(summary))
+        scores.append(counts[keyword])
+    return scores
+
+def count_non_overlapping(matches):
+    """
+    Count (end_index, keyword) matches per keyword, skipping overlapping hits like str.count.
+    """
+    # Các khớp được trả về theo vị trí kết thúc tăng dần; chỉ nhận khớp bắt đầu sau khớp trước đó của cùng từ khóa
+    counts = Counter()
+    last_end = {}
+    for end, keyword in matches:
+        if end - len(keyword) >= last_end.get(keyword, -1):
+            counts[keyword] += 1
+            last_end[keyword] = end
+    return counts
 
 def rank_papers_by_keyword(papers, keyword):
     """
     Rank papers by the frequency of a specific keyword in their summaries.
     """
-    def keyword_count(summary):
-        return summary.lower().count(keyword.lower())
+    papers = PaperStore.from_papers(papers)
+    keyword = keyword.lower()
+    if ahocorasick is not None and keyword:
+        scores = count_keyword_occurrences(papers.summaries_lc, keyword)
+    else:
+        scores = [summary.count(keyword) for summary in papers.summaries_lc]
+    return papers.select(sorted(range(len(scores)), key=scores.__getitem__, reverse=True))
 
-    return sorted(papers, key=lambda paper: keyword_count(paper['summary']), reverse=True)
-
-def generate_word_cloud(text):
+def generate_word_cloud(frequencies, max_words=500, filename="wordcloud.png"):
     """
-    Generate a word cloud from the given text.
+    Generate a word cloud from a keyword frequency counter.
+    Without a display, the image is saved to the given file instead of being shown.
     """
-    wordcloud = WordCloud(width=800, height=400, background_color='white').generate(text)
+    # Import WordCloud và matplotlib tại chỗ vì chỉ chức năng này cần đến chúng
+    import matplotlib
+    headless = sys.platform.startswith('linux') and not (os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))
+    if headless:
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from wordcloud import WordCloud
+
+    wordcloud = WordCloud(width=800, height=400, background_color='white').generate_from_frequencies(dict(frequencies.most_common(max_words)))
     plt.figure(figsize=(10, 5))
     plt.imshow(wordcloud, interpolation='bilinear')
     plt.axis('off')
-    plt.show()
+    if headless:
+        plt.savefig(filename, bbox_inches='tight')
+        plt.close()
+        print(f"Word cloud saved to {filename}")
+    else:
+        plt.show()
 
 def interactive_menu():
     """
     Display an interactive menu for the user to choose actions.
     """
-    papers = []
+    papers = PaperStore()
     while True:
         print("\nMenu:")
         print("1. Fetch papers")
@@ -165,6 +482,8 @@ def interactive_menu():
         if choice == "1":
             keyword = input("Enter search keyword: ")
             num_results = int(input("Enter number of results to display: "))
+            # Kết quả mới thay thế hoàn toàn kết quả cũ, nên bộ nhớ đệm chỉ giữ các bài hiện tại
+            clear_caches()
             papers = fetch_arxiv_papers(keyword, num_results)
             if papers:
                 summarize_papers(papers)
@@ -199,8 +518,7 @@ def interactive_menu():
                 print("No papers to rank.")
         elif choice == "6":
             if papers:
-                all_summaries = " ".join([paper['summary'] for paper in papers])
-                generate_word_cloud(all_summaries)
+                generate_word_cloud(keyword_frequencies(papers))
             else:
                 print("No papers to generate word cloud.")
         elif choice == "7":
@@ -5,12 +5,26 @@ import urllib.parse
 import urllib.request
 import xml.etree.ElementTree as ET
 import json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Constants: URL cơ bản cho ArXiv API
 API_URL = "http://export.arxiv.org/api/query?"
 
+# Tên thẻ Atom đầy đủ, tránh phải phân giải tiền tố namespace ở mỗi lần tìm kiếm
+ATOM_ENTRY = '{http://www.w3.org/2005/Atom}entry'
+ATOM_TITLE = '{http://www.w3.org/2005/Atom}title'
+ATOM_SUMMARY = '{http://www.w3.org/2005/Atom}summary'
+ATOM_AUTHOR_NAME = '{http://www.w3.org/2005/Atom}author/{http://www.w3.org/2005/Atom}name'
+
 # Tải mô hình ngôn ngữ của SpaCy
-nlp = spacy.load("en_core_web_sm")
+nlp = spacy.load("en_core_web_sm", disable=["ner", "lemmatizer", "attribute_ruler", "tagger"])
+
+# Mã băm của các nhãn phụ thuộc, so sánh số nguyên nhanh hơn so sánh chuỗi dep_
+SUBJ_DEPS = {nlp.vocab.strings["nsubj"], nlp.vocab.strings["nsubjpass"]}
+OBJ_DEPS = {nlp.vocab.strings["dobj"], nlp.vocab.strings["pobj"], nlp.vocab.strings["attr"]}
 
 def fetch_arxiv_papers(keyword, num_results=5):
     """
@@ -27,7 +41,7 @@ def fetch_arxiv_papers(keyword, num_results=5):
 
     try:
         response = urllib.request.urlopen(query_url)
-        data = response.read().decode('utf-8')
+        data = response.read()
         return parse_arxiv_results(data)
     except Exception as e:
         print(f"Error fetching papers: {e}")
@@ -37,58 +51,56 @@ def parse_arxiv_results(data):
     """
     Parse XML data returned from ArXiv API and extract paper details.
     """
-    namespace = {'atom': 'http://www.w3.org/2005/Atom'}
     root = ET.fromstring(data)
-    entries = root.findall('atom:entry', namespace)
+    entries = root.findall(ATOM_ENTRY)
 
     papers = []
     for entry in entries:
         try:
-            title = entry.find('atom:title', namespace).text.strip()
-            authors = [author.find('atom:name', namespace).text for author in entry.findall('atom:author', namespace)]
-            summary = entry.find('atom:summary', namespace).text.strip()
+            title = entry.find(ATOM_TITLE).text.strip()
+            authors = [name.text for name in entry.iterfind(ATOM_AUTHOR_NAME)]
+            summary = entry.find(ATOM_SUMMARY).text.strip()
             papers.append({'title': title, 'authors': authors, 'summary': summary})
         except AttributeError:
             continue
     return papers
 
-def preprocess_text(text):
+def analyze(doc, top_n=10):
     """
-    Preprocess text by removing stop words using SpaCy.
-    """
-    doc = nlp(text)
-    return " ".join([token.text for token in doc if token.is_alpha and not token.is_stop])
-
-def extract_keywords(text, top_n=10):
+    Extract keywords and Subject-Verb-Object structures from a parsed Doc.
     """
-    Extract keywords based on frequency from the processed text.
-    """
-    doc = nlp(text)
-    keywords = [token.text for token in doc if token.is_alpha and not token.is_stop]
-    keyword_freq = Counter(keywords)
-    return keyword_freq.most_common(top_n)
+    keyword_freq = Counter(token.text for token in doc if token.is_alpha and not token.is_stop)
+    svos = []
+    # Mỗi câu có đúng một gốc, lấy trực tiếp qua sent.root thay vì quét mọi token
+    for sent in doc.sents:
+        root = sent.root
+        subjects = [w.text for w in root.lefts if w.dep in SUBJ_DEPS]
+        objects = [w.text for w in root.rights if w.dep in OBJ_DEPS]
+        if subjects and objects:
+            svos.append((subjects[0], root.text, objects[0]))
+    return keyword_freq.most_common(top_n), svos
 
-def extract_svo(text):
+def encode_json(obj):
     """
-    Extract Subject-Verb-Object structures from text using SpaCy.
+    Encode an object as compact UTF-8 JSON bytes, using orjson when available.
     """
-    doc = nlp(text)
-    svos = []
-    for token in doc:
-        if token.dep_ == "ROOT":
-            subjects = [w.text for w in token.lefts if w.dep_ in ("nsubj", "nsubjpass")]
-            objects = [w.text for w in token.rights if w.dep_ in ("dobj", "pobj", "attr")]
-            if subjects and objects:
-                svos.append((subjects[0], token.text, objects[0]))
-    return svos
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
 
 def save_to_file(papers, filename="papers.json"):
     """
     Save paper data to a JSON file.
     """
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(papers, f, ensure_ascii=False, indent=4)
+        # Ghi từng bài một để không phải giữ toàn bộ chuỗi JSON trong bộ nhớ
+        with open(filename, 'wb') as f:
+            f.write(b'[\n')
+            for i, paper in enumerate(papers):
+                if i:
+                    f.write(b',\n')
+                f.write(encode_json(paper))
+            f.write(b'\n]\n')
         print(f"Data saved to {filename}")
     except Exception as e:
         print(f"Error saving data: {e}")
@@ -100,9 +112,8 @@ def summarize_papers(papers):
     for paper in papers:
         print(f"Title: {paper['title']}")
         print(f"Authors: {', '.join(paper['authors'])}")
-        processed_text = preprocess_text(paper['summary'])
-        keywords = extract_keywords(processed_text)
-        svos = extract_svo(paper['summary'])
+        # Phân tích tóm tắt một lần, dùng chung Doc cho từ khóa và SVO
+        keywords, svos = analyze(nlp(paper['summary']))
 
         print("Keywords:")
         for word, freq in keywords: